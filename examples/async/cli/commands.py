@@ -117,14 +117,14 @@ async def execute(cmd, args):
     elif args.tcp:
         protocol = "tcp"
 
-    u = uhppote.UhppoteAsync(bind_addr, broadcast_addr, listen_addr, debug)
-    task1 = asyncio.create_task(cmd.f(u, dest, timeout, args, protocol=protocol))
-    task2 = asyncio.create_task(windmill())
-
-    response = await task1
-    with suppress(asyncio.CancelledError):
-        task2.cancel()
-        await task2
+    async with uhppote.UhppoteAsync(bind_addr, broadcast_addr, listen_addr, debug) as u:
+        task1 = asyncio.create_task(cmd.f(u, dest, timeout, args, protocol=protocol))
+        task2 = asyncio.create_task(windmill())
+
+        response = await task1
+        with suppress(asyncio.CancelledError):
+            task2.cancel()
+            await task2
 
     print("\rok    \n")
 
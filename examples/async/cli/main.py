@@ -12,6 +12,14 @@ import traceback
 from .commands import commands
 from .commands import execute
 
+try:
+    if sys.platform == "win32":
+        import winloop as uvloop
+    else:
+        import uvloop
+except ImportError:
+    uvloop = None
+
 
 def parse_args():
     """
@@ -126,4 +134,7 @@ def usage() -> str:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -192,6 +192,85 @@ class TestAsyncListen(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(events, expected["events"])
         self.assertEqual(errors, expected["errors"])
 
+    async def test_listen_handler_error(self):
+        """
+        Tests that exceptions raised by an async event handler are reported to the error handler.
+        """
+        expected = ["handler error 405419896"]
+
+        errors = []
+        close = asyncio.Event()
+
+        async def on_event(event):
+            await asyncio.sleep(0)
+            raise ValueError(f"handler error {event.controller}")
+
+        def on_error(error):
+            errors.append(f"{error}")
+
+        listener = asyncio.create_task(self.u.listen(on_event, on_error=on_error, close=close))
+        await asyncio.sleep(0.1)
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(EVENTS[0], ("127.0.0.1", 60007))
+
+        await asyncio.sleep(0.25)
+        close.set()
+        await listener
+
+        self.assertEqual(errors, expected)
+
+    async def test_listen_queue(self):
+        """
+        Tests queueing received events for a consumer task.
+        """
+        queue = asyncio.Queue(maxsize=2)
+        close = asyncio.Event()
+        errors = []
+
+        def on_error(error):
+            errors.append(f"{error}")
+
+        async def send():
+            for evt in EVENTS:
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                    sock.sendto(evt, ("127.0.0.1", 60007))
+                await asyncio.sleep(0.1)
+            close.set()
+
+        listener = asyncio.create_task(self.u.listen_queue(queue, on_error=on_error, close=close))
+        await asyncio.sleep(0.1)
+        await send()
+        dropped = await listener
+
+        self.assertEqual(queue.get_nowait(), EXPECTED[0])
+        self.assertEqual(queue.get_nowait(), EXPECTED[1])
+        self.assertEqual(dropped, 1)
+        self.assertEqual(errors, ["invalid reply function code (ff)"])
+
+    async def test_listen_reuse_port(self):
+        """
+        Tests the event listener with SO_REUSEPORT enabled.
+        """
+        events = []
+        close = asyncio.Event()
+
+        async def on_event(event):
+            if event is not None:
+                events.append(event)
+
+        listener = asyncio.create_task(self.u.listen(on_event, close=close, reuse_port=True))
+        await asyncio.sleep(0.1)
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(EVENTS[0], ("127.0.0.1", 60007))
+
+        await asyncio.sleep(0.25)
+        close.set()
+        await listener
+
+        self.assertEqual(events, EXPECTED[:1])
+
     async def test_address_in_use(self):
         """
         Tests the event listener with a socket that is already in use.
@@ -1,4 +1,4 @@
-# pylint: disable=too-many-public-methods
+# pylint: disable=too-many-public-methods, too-many-lines
 
 """
 UHPPOTE UDP async function tests.
@@ -6,6 +6,7 @@ UHPPOTE UDP async function tests.
 End-to-end tests for the uhppote functions over a connected UDP socket.
 """
 
+import asyncio
 import unittest
 import socket
 import threading
@@ -61,8 +62,8 @@ def handle(sock, bind, debug):
         if debug:
             dump(message)
         for m in messages():
-            if bytes(m["request"]) == message:
-                connection.sendall(bytes(m["response"]))
+            if m["request"] == message:
+                connection.sendall(m["response"])
                 break
 
     try:
@@ -826,3 +827,177 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
         response = await self.u.restore_default_parameters(controller)
 
         self.assertEqual(response, expected.RestoreDefaultParametersResponse)
+
+
+class TestAsyncTCPConnectionPool(unittest.IsolatedAsyncioTestCase):
+    """
+    Test suite for reusing TCP connections to a controller that keeps the connection open.
+    """
+
+    async def asyncSetUp(self):
+        self.connections = 0
+
+        async def handler(reader, writer):
+            self.connections += 1
+            try:
+                while True:
+                    request = await reader.readexactly(64)
+                    for m in messages():
+                        if m["request"] == request:
+                            writer.write(m["response"])
+                            break
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+        self.server = await asyncio.start_server(handler, "127.0.0.1", 12346)
+        self.u = uhppote.UhppoteAsync("0.0.0.0", "255.255.255.255:60000", "0.0.0.0:60001", False, keepalive=True)
+
+    async def asyncTearDown(self):
+        await self.u.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_connection_reuse(self):
+        """
+        Tests that successive requests to the same controller reuse the same TCP connection.
+        """
+        controller = (CONTROLLER, "127.0.0.1:12346", "tcp")
+
+        for _ in range(3):
+            response = await self.u.get_time(controller)
+            self.assertEqual(response, expected.GetTimeResponse)
+
+        self.assertEqual(self.connections, 1)
+
+    async def test_no_keepalive(self):
+        """
+        Tests that successive requests use a new TCP connection if keepalive is not enabled.
+        """
+        controller = (CONTROLLER, "127.0.0.1:12346", "tcp")
+        u = uhppote.UhppoteAsync("0.0.0.0", "255.255.255.255:60000", "0.0.0.0:60001", False)
+
+        for _ in range(3):
+            response = await u.get_time(controller)
+            self.assertEqual(response, expected.GetTimeResponse)
+
+        self.assertEqual(self.connections, 3)
+
+    async def test_context_manager(self):
+        """
+        Tests that exiting an 'async with' block closes the pooled TCP connections.
+        """
+        controller = (CONTROLLER, "127.0.0.1:12346", "tcp")
+
+        async with uhppote.UhppoteAsync("0.0.0.0", "255.255.255.255:60000", "0.0.0.0:60001", False, keepalive=True) as u:
+            response = await u.get_time(controller)
+            self.assertEqual(response, expected.GetTimeResponse)
+
+        response = await u.get_time(controller)
+        self.assertEqual(response, expected.GetTimeResponse)
+        self.assertEqual(self.connections, 2)
+
+        await u.close()
+
+
+class TestAsyncTCPConnectionDropped(unittest.IsolatedAsyncioTestCase):
+    """
+    Test suite for a pooled TCP connection that the controller closes after reading a request.
+    """
+
+    async def asyncSetUp(self):
+        self.requests = []
+
+        async def handler(reader, writer):
+            try:
+                while True:
+                    request = await reader.readexactly(64)
+                    self.requests.append(request)
+                    if len(self.requests) > 1:
+                        break
+
+                    for m in messages():
+                        if m["request"] == request:
+                            writer.write(m["response"])
+                            break
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+        self.server = await asyncio.start_server(handler, "127.0.0.1", 12349)
+        self.u = uhppote.UhppoteAsync("0.0.0.0", "255.255.255.255:60000", "0.0.0.0:60001", False, keepalive=True)
+
+    async def asyncTearDown(self):
+        await self.u.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_request_not_repeated(self):
+        """
+        Tests that a request is not sent again on a new connection if the pooled connection is closed
+        after the request has been sent.
+        """
+        controller = (CONTROLLER, "127.0.0.1:12349", "tcp")
+
+        response = await self.u.get_time(controller)
+        self.assertEqual(response, expected.GetTimeResponse)
+
+        with self.assertRaises(EOFError):
+            await self.u.open_door(controller, 3)
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[1][1], 0x40)
+
+
+class TestAsyncTCPClosedLoop(unittest.TestCase):
+    """
+    Test suite for pooled TCP connections created on an event loop that has since been closed.
+    """
+
+    def setUp(self):
+        self.closed = []
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(("127.0.0.1", 12347))
+        self.server.listen(2)
+
+        def serve(connection, index):
+            with connection:
+                connection.settimeout(5)
+                try:
+                    while request := connection.recv(64):
+                        for m in messages():
+                            if m["request"] == request:
+                                connection.sendall(m["response"])
+                                break
+                    self.closed.append(index)
+                except OSError:
+                    pass
+
+        def accept():
+            for index in range(2):
+                connection, _ = self.server.accept()
+                threading.Thread(target=serve, args=(connection, index), daemon=True).start()
+
+        threading.Thread(target=accept, daemon=True).start()
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_closed_loop(self):
+        """
+        Tests that a connection pooled on a closed event loop is closed rather than leaked when the
+        controller is next used on a new event loop.
+        """
+        controller = (CONTROLLER, "127.0.0.1:12347", "tcp")
+        u = uhppote.UhppoteAsync("0.0.0.0", "255.255.255.255:60000", "0.0.0.0:60001", False, keepalive=True)
+
+        self.assertEqual(asyncio.run(u.get_time(controller)), expected.GetTimeResponse)
+        self.assertEqual(asyncio.run(u.get_time(controller)), expected.GetTimeResponse)
+
+        time.sleep(0.25)
+        self.assertEqual(self.closed, [0])
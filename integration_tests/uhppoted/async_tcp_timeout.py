@@ -40,9 +40,9 @@ def handle(sock, bind, debug):
         if debug:
             dump(message)
         for m in messages():
-            if bytes(m["request"]) == message:
+            if m["request"] == message:
                 time.sleep(0.5)
-                connection.sendall(bytes(m["response"]))
+                connection.sendall(m["response"])
                 break
 
     try:
@@ -60,13 +60,13 @@ def handle(sock, bind, debug):
         if debug:
             dump(message)
         for m in messages():
-            if bytes(m["request"]) == message:
+            if m["request"] == message:
                 response = m["response"]
                 if len(response) == 64:
-                    sock.sendto(bytes(response), addr)
+                    sock.sendto(response, addr)
                 else:
                     for packet in response:
-                        sock.sendto(bytes(packet), addr)
+                        sock.sendto(packet, addr)
                 break
 
     try:
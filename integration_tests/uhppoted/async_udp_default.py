@@ -14,8 +14,10 @@ import time
 import datetime
 
 from ipaddress import IPv4Address
+from unittest.mock import patch
 
 from uhppoted import uhppote_async as uhppote
+from uhppoted import udp_async
 from uhppoted.net import dump
 
 from uhppoted.structs import Card
@@ -48,6 +50,158 @@ EVENT_INDEX_OVERWRITTEN = 73
 TIME_PROFILE = 29
 TIME_PROFILE_NOT_FOUND = 92
 
+FUNCTIONS = [
+    ("get-controller", "get_controller", (CONTROLLER,), expected.GetControllerResponse),
+    (
+        "set-ip",
+        "set_ip",
+        (CONTROLLER, IPv4Address("192.168.1.100"), IPv4Address("255.255.255.0"), IPv4Address("192.168.1.1")),
+        expected.SetIPResponse,
+    ),
+    ("get-time", "get_time", (CONTROLLER,), expected.GetTimeResponse),
+    ("set-time", "set_time", (CONTROLLER, datetime.datetime(2021, 5, 28, 14, 56, 14)), expected.SetTimeResponse),
+    ("get-status", "get_status", (CONTROLLER,), expected.GetStatusResponse),
+    ("get-status-record", "get_status_record", (CONTROLLER,), expected.GetStatusRecord),
+    ("get-status-record (no event)", "get_status_record", (303986753,), expected.GetStatusRecordNoEvent),
+    ("get-listener", "get_listener", (CONTROLLER,), expected.GetListenerResponse),
+    ("set-listener", "set_listener", (CONTROLLER, IPv4Address("192.168.1.100"), 60001, 15), expected.SetListenerResponse),
+    ("set-listener (no interval)", "set_listener", (CONTROLLER, IPv4Address("192.168.1.100"), 60001), expected.SetListenerResponse),
+    ("get-door-control", "get_door_control", (CONTROLLER, 3), expected.GetDoorControlResponse),
+    ("set-door-control", "set_door_control", (CONTROLLER, 3, 2, 4), expected.SetDoorControlResponse),
+    ("open-door", "open_door", (CONTROLLER, 3), expected.OpenDoorResponse),
+    ("get-cards", "get_cards", (CONTROLLER,), expected.GetCardsResponse),
+    ("get-card", "get_card", (CONTROLLER, CARD), expected.GetCardResponse),
+    ("get-card-record", "get_card_record", (CONTROLLER, CARD), expected.GetCardRecord),
+    ("get-card-by-index", "get_card_by_index", (CONTROLLER, CARD_INDEX), expected.GetCardByIndexResponse),
+    ("get-card-record-by-index", "get_card_record_by_index", (CONTROLLER, CARD_INDEX), expected.GetCardRecordByIndex),
+    (
+        "put-card",
+        "put_card",
+        (CONTROLLER, 123456789, datetime.date(2023, 1, 1), datetime.date(2025, 12, 31), 1, 0, 29, 1, 7531),
+        expected.PutCardResponse,
+    ),
+    ("delete-card", "delete_card", (CONTROLLER, CARD), expected.DeleteCardResponse),
+    ("delete-all-cards", "delete_all_cards", (CONTROLLER,), expected.DeleteAllCardsResponse),
+    ("get-event", "get_event", (CONTROLLER, EVENT_INDEX), expected.GetEventResponse),
+    ("get-event-record", "get_event_record", (CONTROLLER, EVENT_INDEX), expected.GetEventRecord),
+    ("get-event-index", "get_event_index", (CONTROLLER,), expected.GetEventIndexResponse),
+    ("set-event-index", "set_event_index", (CONTROLLER, EVENT_INDEX), expected.SetEventIndexResponse),
+    ("record-special-events", "record_special_events", (CONTROLLER, True), expected.RecordSpecialEventsResponse),
+    ("get-time-profile", "get_time_profile", (CONTROLLER, TIME_PROFILE), expected.GetTimeProfileResponse),
+    ("get-time-profile-record", "get_time_profile_record", (CONTROLLER, TIME_PROFILE), expected.GetTimeProfileRecord),
+    ("delete-all-time-profiles", "delete_all_time_profiles", (CONTROLLER,), expected.DeleteAllTimeProfilesResponse),
+    ("refresh-tasklist", "refresh_tasklist", (CONTROLLER,), expected.RefreshTaskListResponse),
+    ("clear-tasklist", "clear_tasklist", (CONTROLLER,), expected.ClearTaskListResponse),
+    ("set-pc-control", "set_pc_control", (CONTROLLER, True), expected.SetPCControlResponse),
+    ("set-interlock", "set_interlock", (CONTROLLER, 8), expected.SetInterlockResponse),
+    ("activate-keypads", "activate_keypads", (CONTROLLER, True, True, False, True), expected.ActivateKeypadsResponse),
+    ("set-door-passcodes", "set_door_passcodes", (CONTROLLER, 3, 12345, 0, 999999, 54321), expected.SetDoorPasscodesResponse),
+    (
+        "set-door-passcodes-record",
+        "set_door_passcodes_record",
+        (CONTROLLER, 3, [12345, 0, 999999, 54321]),
+        expected.SetDoorPasscodesRecordResponse,
+    ),
+    ("get-antipassback", "get_antipassback", (CONTROLLER,), expected.GetAntiPassbackResponse),
+    ("set-antipassback", "set_antipassback", (CONTROLLER, 2), expected.SetAntiPassbackResponse),
+    ("restore-default-parameters", "restore_default_parameters", (CONTROLLER,), expected.RestoreDefaultParametersResponse),
+]
+
+PACKETS = {}
+
+
+def interned(packet):
+    """
+    Returns the shared bytes object for a canned packet so that identical payloads are only stored once.
+    """
+    packet = bytes(packet)
+    return PACKETS.setdefault(packet, packet)
+
+
+def lookup_table():
+    """
+    Indexes the canned request/responses by the first 8 bytes of the request (SOM, function code and
+    controller serial number), so that a received request is only compared against a handful of candidates.
+    """
+    table = {}
+    for m in messages():
+        if m["response"] is None:
+            packets = []
+        elif len(m["response"]) == 64:
+            packets = [interned(m["response"])]
+        else:
+            packets = [interned(packet) for packet in m["response"]]
+
+        table.setdefault(m["request"][:8], []).append((interned(m["request"]), packets))
+
+    return table
+
+
+RESPONSES = lookup_table()
+
+
+def mismatched(packet):
+    """
+    Returns a copy of a reply packet with a function code (0x20) that does not match the request.
+    """
+    packet = bytearray(packet)
+    packet[1] = 0x20
+    return bytes(packet)
+
+
+# NTS: includes a stray reply with a mismatched function code in the get-all-controllers broadcast replies
+for _request, _replies in RESPONSES[bytes([0x17, 0x94, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])]:
+    if len(_replies) > 1:
+        _replies.insert(1, mismatched(_replies[1]))
+
+STUB = None
+STUB_THREAD = None
+
+
+def start_stub():
+    """
+    Starts the (shared) stub controller on first use. The stub is stopped by tearDownModule.
+    """
+    global STUB, STUB_THREAD  # pylint: disable=global-statement
+
+    if STUB is None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, 0)
+        thread = threading.Thread(target=handle, args=(sock, ("0.0.0.0", 60000), False), daemon=True)
+
+        thread.start()
+        time.sleep(1)
+
+        STUB = sock
+        STUB_THREAD = thread
+
+
+def stop_stub():
+    """
+    Stops the stub controller and waits for the handler thread to close the socket, so that the
+    stub port is released for any subsequent test modules.
+    """
+    global STUB, STUB_THREAD  # pylint: disable=global-statement
+
+    if STUB is not None:
+        sock, thread = STUB, STUB_THREAD
+        STUB, STUB_THREAD = None, None
+
+        # NTS: shutdown wakes the blocked recvfrom (closing the socket does not), even though it
+        #      raises ENOTCONN for an unconnected UDP socket
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+        thread.join()
+
+
+def tearDownModule():  # pylint: disable=invalid-name
+    """
+    Stops the shared stub controller once all the tests in the module have run.
+    """
+    stop_stub()
+
 
 def handle(sock, bind, debug):
     """
@@ -58,27 +212,29 @@ def handle(sock, bind, debug):
     def received(message, addr):
         if debug:
             dump(message)
-        for m in messages():
-            if bytes(m["request"]) == message:
-                response = m["response"]
-                if len(response) == 64:
-                    sock.sendto(bytes(response), addr)
-                else:
-                    for packet in response:
-                        sock.sendto(bytes(packet), addr)
+        for request, replies in RESPONSES.get(message[:8], ()):
+            if request == message:
+                for packet in replies:
+                    sock.sendto(packet, addr)
                 break
 
     try:
-        sock.bind(bind)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, never)
-
-        while True:
-            message, addr = sock.recvfrom(1024)
-            if len(message) == 64:
-                received(message, addr)
-
-    except Exception:  # pylint: disable=broad-exception-caught
-        pass
+        try:
+            sock.bind(bind)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, never)
+        except OSError:
+            return
+
+        # NTS: stop_stub shuts down the socket (empty read) to stop the stub, so socket errors also just exit the loop
+        try:
+            while True:
+                message, addr = sock.recvfrom(1024)
+                if not message:
+                    break
+                if len(message) == 64:
+                    received(message, addr)
+        except OSError:
+            pass
     finally:
         sock.close()
 
@@ -96,16 +252,8 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
         debug = False
 
         cls.u = uhppote.UhppoteAsync(bind, broadcast, listen, debug)
-        cls._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, 0)
-        cls._thread = threading.Thread(target=handle, args=(cls._sock, ("0.0.0.0", 60000), False))
 
-        cls._thread.start()
-        time.sleep(1)
-
-    @classmethod
-    def tearDownClass(cls):
-        cls._sock.close()
-        cls._sock = None
+        start_stub()
 
     async def test_get_all_controllers(self):
         """
@@ -115,77 +263,99 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(response, expected.GetControllersResponse)
 
-    async def test_get_controller(self):
+    async def test_get_all_controllers_expected(self):
         """
-        Tests the get-controller function with defaults.
+        Tests the get-all-controllers function returns as soon as the expected number of controllers
+        have replied.
         """
-        controller = CONTROLLER
-        response = await self.u.get_controller(controller)
+        start = time.monotonic()
+        response = await self.u.get_all_controllers(expected=len(expected.GetControllersResponse))
 
-        self.assertEqual(response, expected.GetControllerResponse)
+        self.assertEqual(response, expected.GetControllersResponse)
+        self.assertLess(time.monotonic() - start, 2.5)
 
-    async def test_set_ip(self):
+    async def test_get_all_controllers_endpoint(self):
         """
-        Tests the set-ip function with defaults.
+        Tests the get-all-controllers function using the asyncio datagram endpoint implementation used on
+        platforms other than Linux.
         """
-        controller = CONTROLLER
-        address = IPv4Address("192.168.1.100")
-        netmask = IPv4Address("255.255.255.0")
-        gateway = IPv4Address("192.168.1.1")
+        with patch("uhppoted.udp_async.sys.platform", "darwin"):
+            response = await self.u.get_all_controllers()
 
-        response = await self.u.set_ip(controller, address, netmask, gateway)
-
-        self.assertEqual(response, expected.SetIPResponse)
+        self.assertEqual(response, expected.GetControllersResponse)
 
-    async def test_get_time(self):
+    async def test_get_all_controllers_mismatched_reply(self):
         """
-        Tests the get-time function with defaults.
+        Tests that get-all-controllers discards a reply with a function code that does not match the
+        request, for both the Linux and the asyncio datagram endpoint implementations.
         """
-        controller = CONTROLLER
-        response = await self.u.get_time(controller)
+        response = await self.u.get_all_controllers()
+        self.assertEqual(response, expected.GetControllersResponse)
 
-        self.assertEqual(response, expected.GetTimeResponse)
+        with patch("uhppoted.udp_async.sys.platform", "darwin"):
+            response = await self.u.get_all_controllers()
+        self.assertEqual(response, expected.GetControllersResponse)
 
-    async def test_set_time(self):
+    async def test_get_all_controllers_rcvbuf(self):
         """
-        Tests the set-time function with defaults.
+        Tests that the rcvbuf constructor argument sets the broadcast socket receive and send buffer sizes
+        and that the OS defaults are left unchanged if rcvbuf is None.
         """
-        controller = CONTROLLER
-        now = datetime.datetime(2021, 5, 28, 14, 56, 14)
+        rcvbuf = 131072
 
-        response = await self.u.set_time(controller, now)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, 0) as sock:
+            default = (
+                sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+                sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+            )
 
-        self.assertEqual(response, expected.SetTimeResponse)
+        read_all = udp_async.UDPAsync._read_all  # pylint: disable=protected-access
+        sizes = []
 
-    async def test_get_status(self):
-        """
-        Tests the get-status function with defaults.
-        """
-        controller = CONTROLLER
+        async def wrapped(self, sock, *args, **kwargs):
+            sizes.append(
+                (
+                    sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+                    sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+                )
+            )
+            return await read_all(self, sock, *args, **kwargs)
 
-        response = await self.u.get_status(controller)
+        u = uhppote.UhppoteAsync("0.0.0.0", "255.255.255.255:60000", "0.0.0.0:60001", False, rcvbuf=rcvbuf)
+        with patch.object(udp_async.UDPAsync, "_read_all", wrapped):
+            response = await u.get_all_controllers(expected=len(expected.GetControllersResponse))
+            self.assertEqual(response, expected.GetControllersResponse)
 
-        self.assertEqual(response, expected.GetStatusResponse)
+            response = await self.u.get_all_controllers(expected=len(expected.GetControllersResponse))
+            self.assertEqual(response, expected.GetControllersResponse)
 
-    async def test_get_status_record(self):
+        # NTS: Linux reports double the requested size
+        self.assertGreaterEqual(sizes[0][0], rcvbuf)
+        self.assertGreaterEqual(sizes[0][1], rcvbuf)
+        self.assertNotEqual(sizes[0][0], default[0])
+        self.assertNotEqual(sizes[0][1], default[1])
+        self.assertEqual(sizes[1], default)
+
+    async def test_get_all_controllers_endpoint_expected(self):
         """
-        Tests the get-status-record function with a valid dest_addr.
+        Tests the get-all-controllers function returns as soon as the expected number of controllers
+        have replied, using the asyncio datagram endpoint implementation.
         """
-        controller = CONTROLLER
+        start = time.monotonic()
+        with patch("uhppoted.udp_async.sys.platform", "darwin"):
+            response = await self.u.get_all_controllers(expected=len(expected.GetControllersResponse))
 
-        record = await self.u.get_status_record(controller)
-
-        self.assertEqual(record, expected.GetStatusRecord)
+        self.assertEqual(response, expected.GetControllersResponse)
+        self.assertLess(time.monotonic() - start, 2.5)
 
-    async def test_get_status_record_no_event(self):
+    async def test_functions(self):
         """
-        Tests the get-status-record function with no events on the controller.
+        Tests the functions that take fixed arguments and return the expected response, in a single
+        test run.
         """
-        controller = 303986753
-
-        record = await self.u.get_status_record(controller)
-
-        self.assertEqual(record, expected.GetStatusRecordNoEvent)
+        for name, function, args, response in FUNCTIONS:
+            with self.subTest(name):
+                self.assertEqual(await getattr(self.u, function)(*args), response)
 
     async def test_get_status_record_invalid_controller_response(self):
         """
@@ -196,108 +366,6 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
         with self.assertRaisesRegex(InvalidResponse, r"invalid controller \(405419896\)"):
             await self.u.get_status_record(controller)
 
-    async def test_get_listener(self):
-        """
-        Tests the get-listener function with defaults.
-        """
-        controller = CONTROLLER
-
-        response = await self.u.get_listener(controller)
-
-        self.assertEqual(response, expected.GetListenerResponse)
-
-    async def test_set_listener(self):
-        """
-        Tests the set-listener function with defaults.
-        """
-        controller = CONTROLLER
-        address = IPv4Address("192.168.1.100")
-        port = 60001
-        interval = 15
-
-        response = await self.u.set_listener(controller, address, port, interval)
-
-        self.assertEqual(response, expected.SetListenerResponse)
-
-    async def test_set_listener_without_interval(self):
-        """
-        Tests the set-listener function with defaults.
-        """
-        controller = CONTROLLER
-        address = IPv4Address("192.168.1.100")
-        port = 60001
-
-        response = await self.u.set_listener(controller, address, port)
-
-        self.assertEqual(response, expected.SetListenerResponse)
-
-    async def test_get_door_control(self):
-        """
-        Tests the get-door-control function with defaults.
-        """
-        controller = CONTROLLER
-        door = 3
-
-        response = await self.u.get_door_control(controller, door)
-
-        self.assertEqual(response, expected.GetDoorControlResponse)
-
-    async def test_set_door_control(self):
-        """
-        Tests the set-door-control function with defaults.
-        """
-        controller = CONTROLLER
-        door = 3
-        delay = 4
-        mode = 2
-
-        response = await self.u.set_door_control(controller, door, mode, delay)
-
-        self.assertEqual(response, expected.SetDoorControlResponse)
-
-    async def test_open_door(self):
-        """
-        Tests the open-door function with defaults.
-        """
-        controller = CONTROLLER
-        door = 3
-
-        response = await self.u.open_door(controller, door)
-
-        self.assertEqual(response, expected.OpenDoorResponse)
-
-    async def test_get_cards(self):
-        """
-        Tests the get-cards function with defaults.
-        """
-        controller = CONTROLLER
-
-        response = await self.u.get_cards(controller)
-
-        self.assertEqual(response, expected.GetCardsResponse)
-
-    async def test_get_card(self):
-        """
-        Tests the get-card function with defaults.
-        """
-        controller = CONTROLLER
-        card = CARD
-
-        response = await self.u.get_card(controller, card)
-
-        self.assertEqual(response, expected.GetCardResponse)
-
-    async def test_get_card_record(self):
-        """
-        Tests the get-card-record function with defaults.
-        """
-        controller = CONTROLLER
-        card = CARD
-
-        record = await self.u.get_card_record(controller, card)
-
-        self.assertEqual(record, expected.GetCardRecord)
-
     async def test_get_card_record_not_found(self):
         """
         Tests the get-card-record function with a missing card.
@@ -328,28 +396,6 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
         with self.assertRaisesRegex(InvalidResponse, r"invalid card \(8165538\)"):
             await self.u.get_card_record(controller, card)
 
-    async def test_get_card_by_index(self):
-        """
-        Tests the get-card-by-index function with defaults.
-        """
-        controller = CONTROLLER
-        index = CARD_INDEX
-
-        response = await self.u.get_card_by_index(controller, index)
-
-        self.assertEqual(response, expected.GetCardByIndexResponse)
-
-    async def test_get_card_record_by_index(self):
-        """
-        Tests the get-card-record-by-index function with defaults.
-        """
-        controller = CONTROLLER
-        index = CARD_INDEX
-
-        record = await self.u.get_card_record_by_index(controller, index)
-
-        self.assertEqual(record, expected.GetCardRecordByIndex)
-
     async def test_get_card_record_by_index_not_found(self):
         """
         Tests the get-card-record function with a missing card.
@@ -380,24 +426,6 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
         with self.assertRaisesRegex(InvalidResponse, r"invalid controller \(405419896\)"):
             await self.u.get_card_record_by_index(controller, index)
 
-    async def test_put_card(self):
-        """
-        Tests the put-card function with defaults.
-        """
-        controller = CONTROLLER
-        card = 123456789
-        start_date = datetime.date(2023, 1, 1)
-        end_date = datetime.date(2025, 12, 31)
-        door1 = 1
-        door2 = 0
-        door3 = 29
-        door4 = 1
-        pin = 7531
-
-        response = await self.u.put_card(controller, card, start_date, end_date, door1, door2, door3, door4, pin)
-
-        self.assertEqual(response, expected.PutCardResponse)
-
     async def test_put_card_record(self):
         """
         Tests the put-card-record function with defaults.
@@ -439,49 +467,6 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
         with self.assertRaisesRegex(InvalidResponse, r"invalid controller \(405419896\)"):
             await self.u.put_card_record(controller, card)
 
-    async def test_delete_card(self):
-        """
-        Tests the delete-card function with defaults.
-        """
-        controller = CONTROLLER
-        card = CARD
-
-        response = await self.u.delete_card(controller, card)
-
-        self.assertEqual(response, expected.DeleteCardResponse)
-
-    async def test_delete_all_cards(self):
-        """
-        Tests the delete-all-cards function with defaults.
-        """
-        controller = CONTROLLER
-
-        response = await self.u.delete_all_cards(controller)
-
-        self.assertEqual(response, expected.DeleteAllCardsResponse)
-
-    async def test_get_event(self):
-        """
-        Tests the get-event function with defaults.
-        """
-        controller = CONTROLLER
-        index = EVENT_INDEX
-
-        response = await self.u.get_event(controller, index)
-
-        self.assertEqual(response, expected.GetEventResponse)
-
-    async def test_get_event_record(self):
-        """
-        Tests the get-event-record function with defaults.
-        """
-        controller = CONTROLLER
-        index = EVENT_INDEX
-
-        record = await self.u.get_event_record(controller, index)
-
-        self.assertEqual(record, expected.GetEventRecord)
-
     async def test_get_event_record_not_found(self):
         """
         Tests the get-event-record function for a non-existent record.
@@ -512,60 +497,6 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
         with self.assertRaisesRegex(InvalidResponse, r"invalid controller \(405419896\)"):
             await self.u.get_event_record(controller, index)
 
-    async def test_get_event_index(self):
-        """
-        Tests the get-event-index function with defaults.
-        """
-        controller = CONTROLLER
-
-        response = await self.u.get_event_index(controller)
-
-        self.assertEqual(response, expected.GetEventIndexResponse)
-
-    async def test_set_event_index(self):
-        """
-        Tests the set-event-index function with defaults.
-        """
-        controller = CONTROLLER
-        index = EVENT_INDEX
-
-        response = await self.u.set_event_index(controller, index)
-
-        self.assertEqual(response, expected.SetEventIndexResponse)
-
-    async def test_record_special_events(self):
-        """
-        Tests the record-special-events function with defaults.
-        """
-        controller = CONTROLLER
-        enabled = True
-
-        response = await self.u.record_special_events(controller, enabled)
-
-        self.assertEqual(response, expected.RecordSpecialEventsResponse)
-
-    async def test_get_time_profile(self):
-        """
-        Tests the get-time-profile function with defaults.
-        """
-        controller = CONTROLLER
-        profile = TIME_PROFILE
-
-        response = await self.u.get_time_profile(controller, profile)
-
-        self.assertEqual(response, expected.GetTimeProfileResponse)
-
-    async def test_get_time_profile_record(self):
-        """
-        Tests the get-time-profile-record function with defaults.
-        """
-        controller = CONTROLLER
-        profile = TIME_PROFILE
-
-        record = await self.u.get_time_profile_record(controller, profile)
-
-        self.assertEqual(record, expected.GetTimeProfileRecord)
-
     async def test_get_time_profile_record_not_found(self):
         """
         Tests the get-time-profile-record function with a non-existent record.
@@ -648,16 +579,6 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(response, expected.SetTimeProfileRecordResponse)
 
-    async def test_delete_all_time_profiles(self):
-        """
-        Tests the delete-all-time-profiles function with defaults.
-        """
-        controller = CONTROLLER
-
-        response = await self.u.delete_all_time_profiles(controller)
-
-        self.assertEqual(response, expected.DeleteAllTimeProfilesResponse)
-
     async def test_add_task(self):
         """
         Tests the add-task function with defaults.
@@ -721,108 +642,6 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(response, expected.AddTaskRecordResponse)
 
-    async def test_refresh_tasklist(self):
-        """
-        Tests the refresh-tasklist function with defaults.
-        """
-        controller = CONTROLLER
-
-        response = await self.u.refresh_tasklist(controller)
-
-        self.assertEqual(response, expected.RefreshTaskListResponse)
-
-    async def test_clear_tasklist(self):
-        """
-        Tests the clear-tasklist function with defaults.
-        """
-        controller = CONTROLLER
-
-        response = await self.u.clear_tasklist(controller)
-
-        self.assertEqual(response, expected.ClearTaskListResponse)
-
-    async def test_set_pc_control(self):
-        """
-        Tests the set-pc-control function with defaults.
-        """
-        controller = CONTROLLER
-        enable = True
-
-        response = await self.u.set_pc_control(controller, enable)
-
-        self.assertEqual(response, expected.SetPCControlResponse)
-
-    async def test_set_interlock(self):
-        """
-        Tests the set-interlock function with defaults.
-        """
-        controller = CONTROLLER
-        interlock = 8
-
-        response = await self.u.set_interlock(controller, interlock)
-
-        self.assertEqual(response, expected.SetInterlockResponse)
-
-    async def test_activate_keypads(self):
-        """
-        Tests the activate-keypads function with defaults.
-        """
-        controller = CONTROLLER
-        reader1 = True
-        reader2 = True
-        reader3 = False
-        reader4 = True
-
-        response = await self.u.activate_keypads(controller, reader1, reader2, reader3, reader4)
-
-        self.assertEqual(response, expected.ActivateKeypadsResponse)
-
-    async def test_set_door_passcodes(self):
-        """
-        Tests the set-door-passcodes function with defaults.
-        """
-        controller = CONTROLLER
-        door = 3
-        passcode1 = 12345
-        passcode2 = 0
-        passcode3 = 999999
-        passcode4 = 54321
-
-        response = await self.u.set_door_passcodes(controller, door, passcode1, passcode2, passcode3, passcode4)
-
-        self.assertEqual(response, expected.SetDoorPasscodesResponse)
-
-    async def test_set_door_passcodes_record(self):
-        """
-        Tests the set-door-passcodes-record function with defaults.
-        """
-        controller = CONTROLLER
-        door = 3
-        passcodes = [12345, 0, 999999, 54321]
-
-        response = await self.u.set_door_passcodes_record(controller, door, passcodes)
-
-        self.assertEqual(response, expected.SetDoorPasscodesRecordResponse)
-
-    async def test_get_antipassback(self):
-        """
-        Tests the get_antipassback function with defaults.
-        """
-        controller = CONTROLLER
-        response = await self.u.get_antipassback(controller)
-
-        self.assertEqual(response, expected.GetAntiPassbackResponse)
-
-    async def test_set_antipassback(self):
-        """
-        Tests the set_antipassback function with defaults.
-        """
-        controller = CONTROLLER
-        antipassback = 2
-        response = await self.u.set_antipassback(controller, antipassback)
-
-        self.assertEqual(response, expected.SetAntiPassbackResponse)
-
     async def test_set_firstcard(self):
         """
         Tests the set_firstcard function with defaults.
@@ -849,13 +668,3 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
         response = await self.u.set_firstcard(controller, door, firstcard)
 
         self.assertEqual(response, True)
-
-    async def test_restore_default_parameters(self):
-        """
-        Tests the restore-default-parameters function with defaults.
-        """
-        controller = CONTROLLER
-
-        response = await self.u.restore_default_parameters(controller)
-
-        self.assertEqual(response, expected.RestoreDefaultParametersResponse)
@@ -45,9 +45,9 @@ def handle(sock, bind, debug):
                 if debug:
                     dump(message)
                 for m in messages():
-                    if bytes(m["request"]) == message:
+                    if m["request"] == message:
                         time.sleep(0.5)
-                        sock.sendto(bytes(m["response"]), addr)
+                        sock.sendto(m["response"], addr)
                         break
     except Exception:  # pylint: disable=broad-exception-caught
         pass
@@ -45,13 +45,13 @@ def handle(sock, bind, debug):
         if debug:
             dump(message)
         for m in messages():
-            if bytes(m["request"]) == message:
+            if m["request"] == message:
                 response = m["response"]
                 if len(response) == 64:
-                    sock.sendto(bytes(response), addr)
+                    sock.sendto(response, addr)
                 else:
                     for packet in response:
-                        sock.sendto(bytes(packet), addr)
+                        sock.sendto(packet, addr)
                 break
 
     try:
@@ -60,6 +60,8 @@ def handle(sock, bind, debug):
 
         while True:
             message, addr = sock.recvfrom(1024)
+            if not message:
+                break
             if len(message) == 64:
                 received(message, addr)
 
@@ -90,7 +92,14 @@ class TestAsyncUDP(unittest.IsolatedAsyncioTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls._sock.close()
+        # NTS: shutdown wakes the blocked recvfrom (closing the socket does not) so that the stub thread
+        #      exits and releases the stub port
+        try:
+            cls._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+        cls._thread.join()
         cls._sock = None
 
     async def test_set_firstcard(self):
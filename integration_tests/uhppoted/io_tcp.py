@@ -47,8 +47,8 @@ def handle(sock, bind, debug):
         if debug:
             dump(message)
         for m in messages():
-            if bytes(m["request"]) == message:
-                connection.sendall(bytes(m["response"]))
+            if m["request"] == message:
+                connection.sendall(m["response"])
                 break
 
     try:
@@ -52,8 +52,8 @@ def handle(sock, bind, debug):
                 if debug:
                     dump(message)
                 for m in messages():
-                    if bytes(m["request"]) == message:
-                        sock.sendto(bytes(m["response"]), addr)
+                    if m["request"] == message:
+                        sock.sendto(m["response"], addr)
                         break
     except Exception:  # pylint: disable=broad-exception-caught
         pass
@@ -3,9 +3,9 @@
 """
 
 # fmt: off
-def messages():
+def canned():
     """
-    List of test request/responses.
+    List of test request/responses, with the packets as lists of byte values.
     """
     return [
         { # get-all-controllers
@@ -780,3 +780,26 @@ def messages():
       },
     ]
 # fmt: on
+
+
+def messages():
+    """
+    List of test request/responses, with the request and response packets converted to bytes.
+    """
+    return MESSAGES
+
+
+def _to_bytes(message):
+    response = message["response"]
+
+    if response is None:
+        pass
+    elif len(response) == 64:
+        response = bytes(response)
+    else:
+        response = [bytes(packet) for packet in response]
+
+    return {"request": bytes(message["request"]), "response": response}
+
+
+MESSAGES = [_to_bytes(m) for m in canned()]
@@ -49,6 +49,9 @@ from .structs import Event
 
 from . import codec
 
+UINT16 = struct.Struct("<H")
+UINT32 = struct.Struct("<L")
+
 
 def get_controller_response(packet):
     """
@@ -1181,7 +1184,7 @@ def unpack_uint16(packet, offset):
         Returns:
            uint16 value.
     """
-    return struct.unpack_from("<H", packet, offset)[0]
+    return UINT16.unpack_from(packet, offset)[0]
 
 
 def unpack_uint32(packet, offset):
@@ -1195,7 +1198,7 @@ def unpack_uint32(packet, offset):
         Returns:
            uint32 value.
     """
-    return struct.unpack_from("<L", packet, offset)[0]
+    return UINT32.unpack_from(packet, offset)[0]
 
 
 def unpack_ipv4(packet, offset):
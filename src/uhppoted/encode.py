@@ -16,6 +16,10 @@ import struct
 from . import codec
 from .structs import DoorMode
 
+UINT16 = struct.Struct("<H")
+UINT32 = struct.Struct("<L")
+DATETIME = struct.Struct("7B")
+
 
 def get_controller_request(controller):
     """
@@ -1160,7 +1164,7 @@ def pack_uint16(v, packet, offset):
            packet (bytearray)  64 byte array.
            offset (int)        Value location in array.
     """
-    struct.pack_into("<H", packet, offset, v)
+    UINT16.pack_into(packet, offset, v)
 
 
 def pack_uint32(v, packet, offset):
@@ -1173,7 +1177,7 @@ def pack_uint32(v, packet, offset):
            packet (bytearray)  64 byte array.
            offset (int)        Value location in array.
     """
-    struct.pack_into("<L", packet, offset, v)
+    UINT32.pack_into(packet, offset, v)
 
 
 def pack_IPv4(v, packet, offset):  # pylint: disable=invalid-name
@@ -1211,8 +1215,17 @@ def pack_datetime(v, packet, offset):
            packet (bytearray)  64 byte array.
            offset (int)        Value location in array.
     """
-    bcd = f"{v:%Y%m%d%H%M%S}"
-    packet[offset : offset + 7] = bytes.fromhex(bcd)
+    DATETIME.pack_into(
+        packet,
+        offset,
+        _bcd(v.year // 100),
+        _bcd(v.year % 100),
+        _bcd(v.month),
+        _bcd(v.day),
+        _bcd(v.hour),
+        _bcd(v.minute),
+        _bcd(v.second),
+    )
 
 
 def pack_HHmm(v, packet, offset):  # pylint: disable=invalid-name
@@ -1253,3 +1266,10 @@ def pack_pin(v, packet, offset):
     packet[offset] = (v >> 0) & 0x00FF
     packet[offset + 1] = (v >> 8) & 0x0FF
     packet[offset + 2] = (v >> 16) & 0x0FF
+
+
+def _bcd(v):
+    """
+    Converts a value in the range [0..99] to the equivalent 2 digit BCD encoded byte.
+    """
+    return ((v // 10) << 4) | (v % 10)
@@ -3,11 +3,13 @@ UHPPOTE network utility functions.
 
 """
 
+import asyncio
 import struct
 import re
 import ipaddress
 
 from collections import namedtuple
+from functools import lru_cache
 
 Controller = namedtuple("Controller", "id address protocol")
 
@@ -16,10 +18,12 @@ WRITE_TIMEOUT = struct.pack("ll", 1, 0)  # 1 second
 NO_TIMEOUT = struct.pack("ll", 0, 0)  # (infinite)
 
 
+@lru_cache(maxsize=128)
 def resolve(addr):
     """
     Resolves an address:port string into the equivalent ( address, port ) tuple. An addr value
-    without a :port suffix defaults to port 60000.
+    without a :port suffix defaults to port 60000. The resolved addresses are cached, since the
+    same controller addresses are typically used for every request.
 
         Parameters:
             addr  (string)  address:port string
@@ -35,6 +39,21 @@ def resolve(addr):
     return (str(address), 60000)
 
 
+def resolve_addr(addr):
+    """
+    Resolves a controller address into the equivalent ( address, port ) tuple using the cached 'resolve'.
+    Non-string addresses (e.g. IPv4Address) are converted to a string first so that they share the same
+    cache entries.
+
+        Parameters:
+            addr  (string | IPv4Address)  address[:port] of the controller
+
+        Returns:
+            (address, port) as a (string, uint16) tuple
+    """
+    return resolve(addr if isinstance(addr, str) else str(addr))
+
+
 def timeout_to_seconds(val, defval=2.5):
     """
     Converts a timeout value to seconds, returning the default value if the supplied value
@@ -49,7 +68,7 @@ def timeout_to_seconds(val, defval=2.5):
     """
     try:
         if val is not None:
-            v = float(f"{val}")
+            v = val if isinstance(val, float) else float(f"{val}")
             if 0.05 <= v <= 30:
                 return v
     except (ValueError, TypeError):
@@ -58,10 +77,50 @@ def timeout_to_seconds(val, defval=2.5):
     return defval
 
 
+if hasattr(asyncio, "timeout"):
+
+    async def wait_for(future, timeout):
+        """
+        Waits for a future to complete or time out, using asyncio.timeout (Python 3.11+).
+
+            Parameters:
+                future  (Future)  Future to wait for.
+                timeout (float)   Timeout (in seconds).
+
+            Returns:
+                Result of the future.
+
+            Raises:
+                asyncio.TimeoutError  If the future did not complete within the timeout.
+        """
+        async with asyncio.timeout(timeout):
+            return await future
+
+else:
+
+    async def wait_for(future, timeout):
+        """
+        Waits for a future to complete or time out, using asyncio.wait_for (Python 3.10).
+
+            Parameters:
+                future  (Future)  Future to wait for.
+                timeout (float)   Timeout (in seconds).
+
+            Returns:
+                Result of the future.
+
+            Raises:
+                asyncio.TimeoutError  If the future did not complete within the timeout.
+        """
+        return await asyncio.wait_for(future, timeout)
+
+
 def disambiguate(v):
     """
     Resolves a controller value that may be a uint32 or a (id,address,protocol) tuple to a
-    Controller named tuple.
+    Controller named tuple. The results for hashable values are cached, since the same controllers
+    are typically used for every request. Unhashable values (e.g. a list) are resolved without
+    caching.
 
         Parameters:
             v  (int | tuple | Controller)  Controller serial number, tuple with (id,address,protocol) fields or
@@ -70,6 +129,15 @@ def disambiguate(v):
         Returns:
             (id, address, protocol) Controller named tuple. address defaults to None and protocol defaults to 'udp'.
     """
+    try:
+        hash(v)
+    except TypeError:
+        return _disambiguate(v)
+
+    return _disambiguate_cached(v)
+
+
+def _disambiguate(v):
     if isinstance(v, int):
         return Controller(v, None, "udp")
 
@@ -89,6 +157,11 @@ def disambiguate(v):
     return Controller(None, None, "udp")
 
 
+_disambiguate_cached = lru_cache(maxsize=256, typed=True)(_disambiguate)
+disambiguate.cache_info = _disambiguate_cached.cache_info
+disambiguate.cache_clear = _disambiguate_cached.cache_clear
+
+
 def is_inaddr_any(addr):
     """
     Checks if an IPv4 address is '0.0.0.0'.
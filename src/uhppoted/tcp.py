@@ -31,6 +31,7 @@ class TCP:
                           address:port combination.
         """
         self._bind = (bind, 0)
+        self._bind_any = net.is_inaddr_any(self._bind)
         self._debug = debug
 
     def send(self, request, dest_addr, timeout=2.5):
@@ -52,13 +53,14 @@ class TCP:
         """
         self.dump(request)
 
-        addr = net.resolve(f"{dest_addr}")
+        addr = net.resolve_addr(dest_addr)
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, net.WRITE_TIMEOUT)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, net.READ_TIMEOUT)
 
-            if not net.is_inaddr_any(self._bind):
+            if not self._bind_any:
                 sock.bind(self._bind)
 
             sock.connect(addr)
@@ -90,22 +92,32 @@ def _read(sock, timeout=2.5, debug=False):
     if debug is True.
 
         Parameters:
-            sock    (socket)  Initialised and open UDP socket.
+            sock    (socket)  Initialised and open TCP socket.
             timeout (float)   Optional operation timeout (in seconds). Defaults to 2.5s.
             debug   (bool)    Enables dumping the received packet to the console.
 
         Returns:
-            Received 64 byte UDP packet (or None).
+            Received 64 byte TCP packet.
+
+        Raises:
+            EOFError  If the connection was closed before a complete packet was received.
     """
     time_limit = net.timeout_to_seconds(timeout)
 
     sock.settimeout(time_limit)
 
-    while True:
-        reply = sock.recv(1024)
-        if len(reply) == 64:
-            if debug:
-                net.dump(reply)
-            return reply
+    # NTS: TCP is a stream so the reply may arrive in fragments
+    reply = bytearray(64)
+    buffer = memoryview(reply)
+    received = 0
+
+    while received < 64:
+        if (n := sock.recv_into(buffer[received:])) == 0:
+            raise EOFError("TCP connection closed")
+
+        received += n
+
+    if debug:
+        net.dump(reply)
 
-    return None
+    return bytes(reply)
@@ -6,52 +6,91 @@ access controller.
 """
 
 import asyncio
+import socket
 
 from . import net
 
+IDLE_TIMEOUT = 15  # seconds
 
-class SendProtocol(asyncio.Protocol):
+
+class SendProtocol(asyncio.BufferedProtocol):
     """
-    asycnio protocol implementation for TCP single request/response.
+    asycnio protocol implementation for TCP request/response. The response is received directly into a
+    preallocated 64 byte buffer and the connection can be reused for subsequent requests once the response
+    has been received.
     """
 
-    def __init__(self, request, debug=False):
+    def __init__(self, debug=False):
         self._transport = None
-        self._request = request
         self._debug = debug
-        self._done = asyncio.get_running_loop().create_future()
-        self._buffer = bytearray()
+        self._loop = asyncio.get_running_loop()
+        self._done = None
+        self._buffer = bytearray(64)
+        self._view = memoryview(self._buffer)
+        self._received = 0
 
     def connection_made(self, transport):
         self._transport = transport
-        self._transport.write(self._request)
-        if self._request[1] == 0x96:
+
+    def send(self, request):
+        """
+        Sends a request on the connection. The response is returned by 'run'.
+        """
+        self._done = self._loop.create_future()
+        self._received = 0
+        self._transport.write(request)
+        if request[1] == 0x96:
             self._done.set_result(None)
 
-    def data_received(self, data):
-        self._buffer.extend(data)
-        if len(self._buffer) >= 64 and not self._done.done():
-            packet = bytes(self._buffer[:64])
-            if self._debug:
-                net.dump(packet)
-            self._done.set_result(packet)
+    def get_buffer(self, sizehint):
+        # NTS: anything received after a complete packet is discarded by just overwriting the buffer
+        if self._received < 64:
+            return self._view[self._received :]
+
+        return self._view
+
+    def buffer_updated(self, nbytes):
+        if self._received < 64:
+            self._received += nbytes
+            if self._received >= 64 and self._done is not None and not self._done.done():
+                packet = bytes(self._buffer)
+                if self._debug:
+                    net.dump(packet)
+                self._done.set_result(packet)
+        else:
+            # NTS: counts anything received after a complete packet so that the connection is not reused
+            self._received += nbytes
 
     def eof_received(self):
-        if not self._done.done():
+        if self._done is not None and not self._done.done():
             self._done.set_exception(EOFError())
 
     def connection_lost(self, exc):
-        if exc is not None and not self._done.done():
-            self._done.set_exception(ConnectionResetError())
-        elif not self._done.done():
-            self._done.set_exception(EOFError())
+        if self._done is not None and not self._done.done():
+            if exc is not None:
+                self._done.set_exception(ConnectionResetError())
+            else:
+                self._done.set_exception(EOFError())
+
+    def reusable(self):
+        """
+        Returns True if the connection is still open on the current event loop and nothing has been
+        received since the last response.
+        """
+        if self._transport is None or self._transport.is_closing() or self._received > 64:
+            return False
+
+        try:
+            return self._loop is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
 
     async def run(self, timeout):
         """
-        Waits for the response to the request sent in 'connection_made' or a timeout.
+        Waits for the response to the request sent by 'send' or a timeout.
         """
         try:
-            return await asyncio.wait_for(self._done, timeout)
+            return await net.wait_for(self._done, timeout)
         except asyncio.TimeoutError as exc:
             raise TimeoutError("TCP request timeout") from exc
         except ConnectionResetError as exc:
@@ -63,15 +102,22 @@ class SendProtocol(asyncio.Protocol):
 class TCPAsync:
     """
     async implementation of the TCP transport for the UHPPOTE request/response protocol.
+
+    If keepalive is enabled, connections to a controller are kept open for reuse by subsequent requests
+    until they have been idle for IDLE_TIMEOUT seconds, the controller closes the connection or the
+    transport is closed.
     """
 
-    def __init__(self, bind="0.0.0.0", debug=False):
+    def __init__(self, bind="0.0.0.0", debug=False, keepalive=False):
         """
         Initialises an asynchronous TCP communications wrapper with the bind address.
 
             Parameters:
                bind      (string)  The IPv4 address:port to which to bind when sending a request.
                debug     (bool)    Dumps the sent and received packets to the console if enabled.
+               keepalive (bool)    Keeps the connection to a controller open for reuse by subsequent
+                                   requests until it has been idle for IDLE_TIMEOUT seconds. Defaults
+                                   to False (a new connection for each request).
 
             Returns:
                Initialised TCP object.
@@ -81,12 +127,16 @@ class TCPAsync:
                           address:port combination.
         """
         self._bind = (bind, 0)
+        self._bind_any = net.is_inaddr_any(self._bind)
         self._debug = debug
+        self._keepalive = keepalive
+        self._pool = {}
 
     async def send(self, request, dest_addr, timeout=2.5):
         """
-        Binds to the bind address from the constructor and connects to the access controller after which it sends
-        the request and waits 'timeout' seconds for the reply (if any).
+        Sends the request to the access controller on a pooled connection (if keepalive is enabled) or on
+        a new connection bound to the bind address from the constructor, after which it waits 'timeout' seconds for the reply
+        (if any).
 
             Parameters:
                request   (bytearray)  64 byte request packet.
@@ -100,22 +150,108 @@ class TCPAsync:
             Raises:
                Error  For any socket related errors.
         """
-        self.dump(request)
+        if self._debug:
+            net.dump(request)
+
+        addr = net.resolve_addr(dest_addr)
+
+        # NTS: a pooled connection that the controller has closed (or that has received unsolicited data) while idle
+        #      is discarded by _checkout before the request is written. Once the request has been written any error
+        #      is returned to the caller rather than retried, because the controller may already have executed the
+        #      request (e.g. open-door, put-card).
+        connection = self._checkout(addr) if self._keepalive else None
+        if connection is None:
+            connection = await self._connect(addr)
+
+        return await self._exchange(addr, connection, request, timeout)
+
+    async def close(self):
+        """
+        Closes any pooled connections.
+        """
+        pool = self._pool
+        self._pool = {}
+
+        for connections in pool.values():
+            for sock, transport, _, idle in connections:
+                idle.cancel()
+                _close(sock, transport)
 
-        host, port = net.resolve(f"{dest_addr}")
+    async def _connect(self, addr):
+        """
+        Opens a new connection to the controller, bound to the bind address from the constructor.
+        """
         loop = asyncio.get_running_loop()
 
-        if net.is_inaddr_any(self._bind):
-            transport, protocol = await loop.create_connection(lambda: SendProtocol(request, self._debug), host, port)
-        else:
-            transport, protocol = await loop.create_connection(
-                lambda: SendProtocol(request, self._debug), host, port, local_addr=self._bind
-            )
+        # NTS: the socket is created here rather than by create_connection so that a pooled connection
+        #      can still be closed if the event loop on which it was created has been closed
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setblocking(False)
+            if not self._bind_any:
+                sock.bind(self._bind)
+
+            await loop.sock_connect(sock, addr)
+            transport, protocol = await loop.create_connection(lambda: SendProtocol(self._debug), sock=sock)
+        except BaseException:
+            sock.close()
+            raise
+
+        return (sock, transport, protocol)
+
+    async def _exchange(self, addr, connection, request, timeout):
+        """
+        Sends a request on a connection and waits for the reply, returning the connection to the pool
+        if it can be reused.
+        """
+        sock, transport, protocol = connection
 
         try:
-            return await protocol.run(timeout)
-        finally:
+            protocol.send(request)
+            reply = await protocol.run(timeout)
+        except BaseException:
             transport.close()
+            raise
+
+        # NTS: set-ip changes the controller address so the connection is not reusable
+        if self._keepalive and request[1] != 0x96 and protocol.reusable():
+            self._checkin(addr, sock, transport, protocol)
+        else:
+            transport.close()
+
+        return reply
+
+    def _checkout(self, addr):
+        """
+        Returns a pooled connection to the controller (if any).
+        """
+        connections = self._pool.get(addr, [])
+        while connections:
+            sock, transport, protocol, idle = connections.pop()
+            idle.cancel()
+            if protocol.reusable():
+                return (sock, transport, protocol)
+
+            _close(sock, transport)
+
+        return None
+
+    def _checkin(self, addr, sock, transport, protocol):
+        """
+        Returns a connection to the pool, to be closed after IDLE_TIMEOUT seconds if not reused.
+        """
+        connections = self._pool.setdefault(addr, [])
+
+        def expire():
+            for i, connection in enumerate(connections):
+                if connection[1] is transport:
+                    del connections[i]
+                    transport.close()
+                    break
+
+        idle = asyncio.get_running_loop().call_later(IDLE_TIMEOUT, expire)
+
+        connections.append((sock, transport, protocol, idle))
 
     def dump(self, packet):
         """
@@ -130,3 +266,14 @@ class TCPAsync:
         """
         if self._debug:
             net.dump(packet)
+
+
+def _close(sock, transport):
+    """
+    Closes a pooled transport, closing the underlying socket directly if the event loop on which it was
+    created has already been closed.
+    """
+    try:
+        transport.close()
+    except RuntimeError:
+        sock.close()
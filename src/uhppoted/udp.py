@@ -152,7 +152,7 @@ class UDP:
             if dest_addr is None:
                 sock.sendto(request, self._broadcast)
             else:
-                addr = net.resolve(f"{dest_addr}")
+                addr = net.resolve_addr(dest_addr)
                 sock.sendto(request, addr)
 
             if request[1] == 0x96:
@@ -7,9 +7,12 @@ access controller.
 
 import asyncio
 import socket
+import sys
 
 from . import net
 
+MAX_DRAIN = 32  # datagrams per readable event
+
 
 class InvalidBindPort(Exception):
     """Exception raised when the bind port is the same as the broadcast port.
@@ -28,53 +31,45 @@ class BroadcastProtocol(asyncio.Protocol):
     asyncio protocol implementation for UDP broadcast single request/multiple response.
     """
 
-    def __init__(self, request, dest, debug=False):
+    def __init__(self, request, dest, debug=False, expected=None):
         self._transport = None
         self._request = request
         self._dest = dest
+        self._expected = expected
         self._replies = []
         self._debug = debug
         self._done = asyncio.get_running_loop().create_future()
 
     def connection_made(self, transport):
         self._transport = transport
-
-        # NTS: avoid broadcast-to-self
-        if sock := transport.get_extra_info("socket"):
-            _, src_port = sock.getsockname()
-            _, dest_port = self._dest
-
-            if src_port == dest_port:
-                self._done.set_exception(InvalidBindPort(f"invalid UDP bind address (port {src_port} reserved for broadcast)"))
-                # NTS: do NOT close here otherwise OS will potentially assign it again and we don't want that
-                # self._transport.close()
-                return
-
         self._transport.sendto(self._request, self._dest)
 
     def datagram_received(self, packet, _addr):
         """
-        Collects valid'ish received packets into the 'replies' list that is returned on timeout.
+        Collects valid'ish received packets into the 'replies' list that is returned on timeout (or
+        when the expected number of replies has been received). Packets with a function code that does
+        not match the request are discarded.
         """
-        if len(packet) == 64:
+        if len(packet) == 64 and packet[1] == self._request[1]:
             self._replies.append(packet)
             if self._debug:
                 net.dump(packet)
 
+            if self._expected and len(self._replies) >= self._expected and not self._done.done():
+                self._done.set_result(None)
+
     def connection_lost(self, exc):
         pass
 
     async def run(self, timeout):
         """
-        Returns the collected replies after a delay.
+        Returns the collected replies after a delay or once the expected number of replies has been
+        received.
         """
         try:
-            await asyncio.wait_for(self._done, timeout)
+            await net.wait_for(self._done, timeout)
         except asyncio.TimeoutError:
-            return self._replies
-
-        if self._done.exception():
-            raise self._done.exception()
+            pass
 
         return self._replies
 
@@ -126,7 +121,7 @@ class SendProtocol(asyncio.Protocol):
         Waits for 'done' or timeout, returning the received packet on 'done'.
         """
         try:
-            return await asyncio.wait_for(self._done, timeout)
+            return await net.wait_for(self._done, timeout)
         except asyncio.TimeoutError as exc:
             raise TimeoutError("UDP request timeout") from exc
         except ConnectionResetError as exc:
@@ -141,15 +136,21 @@ class EventProtocol(asyncio.DatagramProtocol):
     def __init__(self, on_event, debug=False):
         self._transport = None
         self._on_event = on_event
-        self._debug = debug
+
+        # NTS: dumps the received events by wrapping the handler so that the non-debug path is just the handler
+        if debug:
+
+            def dump(data):
+                net.dump(data)
+                on_event(data)
+
+            self._on_event = dump
 
     def connection_made(self, transport):
         self._transport = transport
 
     def datagram_received(self, data, addr):
         if len(data) == 64:
-            if self._debug:
-                net.dump(data)
             self._on_event(data)
 
     def error_received(self, exc):
@@ -164,7 +165,7 @@ class UDPAsync:
     async implementation of the UDP transport for the UHPPOTE request/response protocol.
     """
 
-    def __init__(self, bind="0.0.0.0", broadcast="255.255.255.255:60000", listen="0.0.0.0:60001", debug=False):
+    def __init__(self, bind="0.0.0.0", broadcast="255.255.255.255:60000", listen="0.0.0.0:60001", debug=False, rcvbuf=None):
         """
         Initialises an asynchronous UDP communications wrapper with the bind address, broadcast address
         and listen address.
@@ -175,6 +176,10 @@ class UDPAsync:
                listen    (string)  The IPv4 address:port on which to listen for events from the
                                    access controllers.
                debug     (bool)    Dumps the sent and received packets to the console if enabled.
+               rcvbuf    (int)     Optional socket buffer size (in bytes) for broadcast requests, used
+                                   for both the receive (SO_RCVBUF) and send (SO_SNDBUF) buffers.
+                                   Defaults to the OS default if None. The size is capped by
+                                   net.core.rmem_max/wmem_max on Linux.
 
             Returns:
                Initialised UDP object.
@@ -187,8 +192,9 @@ class UDPAsync:
         self._broadcast = net.resolve(broadcast)
         self._listen = net.resolve(listen)
         self._debug = debug
+        self._rcvbuf = rcvbuf
 
-    async def broadcast(self, request, timeout=2.5):
+    async def broadcast(self, request, timeout=2.5, expected=None):
         """
         Binds to the bind address from the constructor and then broadcasts a UDP request to the broadcast
         address from the constructor and then waits 'timeout' seconds for the replies from any reponding
@@ -197,6 +203,8 @@ class UDPAsync:
             Parameters:
                request  (bytearray)  64 byte request packet.
                 timeout (float)      Optional operation timeout (in seconds). Defaults to 2.5s.
+               expected (int)        Optional number of expected replies. Returns as soon as the expected
+                                     number of replies has been received if set.
 
             Returns:
                List of received response packets (may be empty).
@@ -204,34 +212,119 @@ class UDPAsync:
             Raises:
                Error  For any socket related errors.
         """
-        self.dump(request)
+        if self._debug:
+            net.dump(request)
 
-        loop = asyncio.get_running_loop()
-        transports = []
+        sockets = []
 
         try:
             _, src_port = self._bind
             _, dest_port = self._broadcast
 
             for _ in range(5):
-                transport, protocol = await loop.create_datagram_endpoint(
-                    lambda: BroadcastProtocol(request, self._broadcast, self._debug),
-                    local_addr=self._bind,
-                    allow_broadcast=True,
-                )
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, 0)
+                sockets.append(sock)
 
-                transports.append(transport)
+                sock.setblocking(False)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+                if self._rcvbuf is not None:
+                    _set_buffers(sock, self._rcvbuf)
+                sock.bind(self._bind)
 
-                try:
-                    return await protocol.run(timeout)
-                except InvalidBindPort as e:
-                    if src_port != 0:
-                        raise RuntimeError(f"invalid UDP bind address - port {src_port} is reserved for broadcast)") from e
+                # NTS: avoid broadcast-to-self (and do NOT close the socket until done otherwise the OS will
+                #      potentially assign the same port again)
+                _, port = sock.getsockname()
+                if port != dest_port:
+                    if sys.platform == "linux":
+                        return await self._read_all(sock, request, timeout, expected)
+
+                    return await self._read_endpoint(sock, request, timeout, expected)
+
+                if src_port != 0:
+                    raise RuntimeError(f"invalid UDP bind address - port {src_port} is reserved for broadcast)")
 
             raise RuntimeError(f"OS returned UDP bind socket with port {dest_port} (reserved for broadcast)")
         finally:
-            for transport in transports:
-                transport.close()
+            for sock in sockets:
+                sock.close()
+
+    async def _read_endpoint(self, sock, request, timeout, expected=None):
+        """
+        Broadcasts a request on a UDP socket wrapped in an asyncio datagram endpoint and accumulates the
+        received 64 byte replies until the timeout expires (or the expected number of replies has been
+        received). Used on platforms other than Linux.
+
+            Parameters:
+                sock     (socket)  Initialised, bound and non-blocking UDP socket.
+                request  (bytes)   64 byte request packet.
+                timeout  (float)   Operation timeout (in seconds).
+                expected (int)     Optional number of expected replies.
+
+            Returns:
+                List of received 64 byte UDP packets (may be empty).
+        """
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_datagram_endpoint(
+            lambda: BroadcastProtocol(request, self._broadcast, self._debug, expected),
+            sock=sock,
+        )
+
+        try:
+            return await protocol.run(timeout)
+        finally:
+            transport.close()
+
+    async def _read_all(self, sock, request, timeout, expected=None):
+        """
+        Broadcasts a request on a non-blocking UDP socket and accumulates the received 64 byte replies (with
+        the same function code as the request) until the timeout expires (or the expected number of replies
+        has been received). Reads the replies directly from the socket, draining all the queued replies each
+        time the socket is readable rather than receiving a single datagram per event loop iteration (Linux).
+
+            Parameters:
+                sock     (socket)  Initialised, bound and non-blocking UDP socket.
+                request  (bytes)   64 byte request packet.
+                timeout  (float)   Operation timeout (in seconds).
+                expected (int)     Optional number of expected replies.
+
+            Returns:
+                List of received 64 byte UDP packets (may be empty).
+        """
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        replies = []
+        buffer = bytearray(1024)
+        view = memoryview(buffer)
+
+        # NTS: replies are received into a single reusable buffer and only valid'ish 64 byte packets are copied out.
+        #      Reads at most MAX_DRAIN datagrams per readable event so as not to starve other tasks - anything left
+        #      over is picked up on the next event loop iteration.
+        def drain():
+            for _ in range(MAX_DRAIN):
+                try:
+                    n = sock.recv_into(buffer)
+                except OSError:
+                    return
+
+                if n == 64 and buffer[1] == request[1]:
+                    packet = bytes(view[:64])
+                    replies.append(packet)
+                    if self._debug:
+                        net.dump(packet)
+
+                    if expected and len(replies) >= expected and not done.done():
+                        done.set_result(None)
+
+        loop.add_reader(sock.fileno(), drain)
+        try:
+            sock.sendto(request, self._broadcast)
+            await net.wait_for(done, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            loop.remove_reader(sock.fileno())
+
+        return replies
 
     async def send(self, request, dest_addr=None, timeout=2.5):
         """
@@ -250,13 +343,14 @@ class UDPAsync:
             Raises:
                Error  For any socket related errors.
         """
-        self.dump(request)
+        if self._debug:
+            net.dump(request)
 
         loop = asyncio.get_running_loop()
         transports = []
 
         try:
-            addr = self._broadcast if dest_addr is None else net.resolve(f"{dest_addr}")
+            addr = self._broadcast if dest_addr is None else net.resolve_addr(dest_addr)
 
             _, src_port = self._bind
             _, dest_port = addr
@@ -290,16 +384,19 @@ class UDPAsync:
             for transport in transports:
                 transport.close()
 
-    async def listen(self, on_event, close=None):
+    async def listen(self, on_event, close=None, reuse_port=False):
         """
         Binds to the listen address from the constructor and invokes the events handler for
         any received 64 byte UDP packets. Invalid'ish packets are silently discarded.
 
             Parameters:
-               on_event  (function)      Handler function for received events, with a function signature
-                                         fn(packet).
-               close     (asyncio.Event) Optional signal to close listening socket and stop listening
-                                         for events.
+               on_event   (function)      Handler function for received events, with a function signature
+                                          fn(packet).
+               close      (asyncio.Event) Optional signal to close listening socket and stop listening
+                                          for events.
+               reuse_port (bool)          Enables SO_REUSEPORT on the listening socket so that multiple
+                                          processes can share the listen address, with the kernel
+                                          distributing the received events between them.
 
             Returns:
                None.
@@ -314,6 +411,7 @@ class UDPAsync:
             lambda: EventProtocol(on_event, self._debug),
             local_addr=self._listen,
             family=socket.AF_INET,
+            reuse_port=reuse_port,
         )
 
         try:
@@ -336,3 +434,12 @@ class UDPAsync:
         """
         if self._debug:
             net.dump(packet)
+
+
+def _set_buffers(sock, size):
+    """
+    Sets both the socket receive and send buffer sizes to 'size', so that a burst of replies to a broadcast
+    request is not dropped by the kernel before it can be read.
+    """
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, size)
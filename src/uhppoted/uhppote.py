@@ -5,6 +5,7 @@ Implements a Python wrapper around the UHPPOTE TCP/IP access controller API.
 """
 
 import datetime
+import logging
 
 from . import decode
 from . import encode
@@ -29,6 +30,8 @@ from .errors import EventOverwritten
 from .errors import TimeProfileNotFound
 from .errors import InvalidResponse
 
+_log = logging.getLogger(__name__)
+
 
 class Uhppote:
     """
@@ -73,11 +76,7 @@ class Uhppote:
         request = encode.get_controller_request(0)
         replies = self._udp.broadcast(request, timeout=timeout)
 
-        responses = []
-        for reply in replies:
-            responses.append(decode.get_controller_response(reply))
-
-        return responses
+        return [decode.get_controller_response(reply) for reply in replies]
 
     def get_controller(self, controller, timeout=2.5):
         """
@@ -1782,8 +1781,8 @@ class Uhppote:
         def handler(packet):
             try:
                 on_event(decode.event(packet))
-            except BaseException as exc:  # pylint: disable=broad-exception-caught
-                print(f"   *** ERROR {exc}", flush=True)
+            except Exception:  # pylint: disable=broad-exception-caught
+                _log.exception("event handler failed")
 
         self._udp.listen(handler)
 
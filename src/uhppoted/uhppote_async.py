@@ -36,7 +36,9 @@ class UhppoteAsync:
     async API implementation for the UHPPOTE access controller request/response protocol.
     """
 
-    def __init__(self, bind="0.0.0.0", broadcast="255.255.255.255:60000", listen="0.0.0.0:60001", debug=False):
+    def __init__(
+        self, bind="0.0.0.0", broadcast="255.255.255.255:60000", listen="0.0.0.0:60001", debug=False, rcvbuf=None, keepalive=False
+    ):  # pylint: disable=too-many-arguments, too-many-positional-arguments
         """
         Initialises a UhppoteAsync object with the bind address, broadcast address and listen address.
 
@@ -46,6 +48,13 @@ class UhppoteAsync:
                listen    (string)  The IPv4 address:port on which to listen for events from the
                                    access controllers.
                debug     (bool)    Enables verbose debugging information.
+               rcvbuf    (int)     Optional UDP socket buffer size (in bytes) for broadcast requests, used
+                                   for both the receive (SO_RCVBUF) and send (SO_SNDBUF) buffers.
+                                   Defaults to the OS default if None. The size is capped by
+                                   net.core.rmem_max/wmem_max on Linux.
+               keepalive (bool)    Keeps TCP connections to the access controllers open for reuse by
+                                   subsequent requests until they have been idle for 15 seconds.
+                                   Defaults to False (a new TCP connection for each request).
 
             Returns:
                Initialised Uhppote object.
@@ -54,15 +63,17 @@ class UhppoteAsync:
                ValueError  If any of the supplied IPv4 values cannot be translated to a valid IPv4
                            address:port combination.
         """
-        self._udp = udp.UDPAsync(bind, broadcast, listen, debug)
-        self._tcp = tcp.TCPAsync(bind, debug)
+        self._udp = udp.UDPAsync(bind, broadcast, listen, debug, rcvbuf)
+        self._tcp = tcp.TCPAsync(bind, debug, keepalive)
 
-    async def get_all_controllers(self, timeout=2.5):
+    async def get_all_controllers(self, timeout=2.5, expected=None):
         """
         Retrieves a list of all controllers accessible on the local LAN segment.
 
             Parameters:
-              timeout (float)  Optional operation timeout (in seconds). Defaults to 2.5s.
+              timeout  (float)  Optional operation timeout (in seconds). Defaults to 2.5s.
+              expected (int)    Optional number of controllers expected to reply. Returns as soon as
+                                the expected number of controllers have replied if set.
 
             Returns:
                []GetControllerResponse  List of get_controller_responses from access controllers
@@ -72,13 +83,9 @@ class UhppoteAsync:
                Exception  If any of the responses from the access controllers cannot be decoded.
         """
         request = encode.get_controller_request(0)
-        replies = await self._udp.broadcast(request, timeout=timeout)
-
-        responses = []
-        for reply in replies:
-            responses.append(decode.get_controller_response(reply))
+        replies = await self._udp.broadcast(request, timeout=timeout, expected=expected)
 
-        return responses
+        return [decode.get_controller_response(reply) for reply in replies]
 
     async def get_controller(self, controller, timeout=2.5):
         """
@@ -1769,7 +1776,7 @@ class UhppoteAsync:
 
         return None
 
-    async def listen(self, on_event, *, on_error=None, close=None):
+    async def listen(self, on_event, *, on_error=None, close=None, reuse_port=False):
         """
         Establishes a listener for events from the access controllers by binding to the UDP listen
         address from the constructor.
@@ -1780,46 +1787,131 @@ class UhppoteAsync:
                                      coroutine, it is scheduled as a task.
 
                on_error (callable, optional)  Optional error handler with signature
-                                              on_error(exception) -> None or awaitable. Errors and warnings are
-                                              silently discarded if omitted.
+                                              on_error(exception) -> None or awaitable. Also invoked for
+                                              exceptions raised by a coroutine event handler. Errors and
+                                              warnings are silently discarded if omitted.
 
                close     (asyncio.Event) Optional signal to close listening socket and stop listening
                                          for events.
 
+               reuse_port (bool)  Enables SO_REUSEPORT on the listen socket so that the events can be
+                                  distributed across multiple listening processes (Linux/BSD only).
+
             Returns:
                None
         """
 
+        # NTS: keeps a reference to the handler tasks so that they are not garbage collected before completing
+        tasks = set()
+
+        def report(exc):
+            _report(on_error, exc, tasks)
+
+        def done(task):
+            tasks.discard(task)
+            if not task.cancelled() and (exc := task.exception()) is not None:
+                report(exc)
+
         def dispatch(packet):
             try:
                 event = decode.event(packet)
                 result = on_event(event)
                 if asyncio.iscoroutine(result):
-                    asyncio.create_task(result)
-            except BaseException as exc:  # pylint: disable=broad-exception-caught
-                if on_error is not None:
-                    err = on_error(exc)
-                    if asyncio.iscoroutine(err):
-                        asyncio.create_task(err)
+                    task = asyncio.create_task(result)
+                    tasks.add(task)
+                    task.add_done_callback(done)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                report(exc)
 
-        await self._udp.listen(dispatch, close)
+        await self._udp.listen(dispatch, close, reuse_port)
 
-    async def _send(self, request, dest_addr, timeout, protocol):
+    async def listen_queue(self, queue, *, on_error=None, close=None, reuse_port=False):
+        """
+        Establishes a listener for events from the access controllers by binding to the UDP listen
+        address from the constructor and puts the received events on a queue for processing by a
+        consumer task, so that a slow event handler does not hold up the receiving socket. Events
+        received while the queue is full are discarded.
+
+            Parameters:
+               queue     (asyncio.Queue) Queue for received events.
+
+               on_error (callable, optional)  Optional error handler with signature
+                                              on_error(exception) -> None or awaitable. Errors and
+                                              warnings are silently discarded if omitted.
+
+               close     (asyncio.Event) Optional signal to close listening socket and stop listening
+                                         for events.
+
+               reuse_port (bool)  Enables SO_REUSEPORT on the listen socket so that the events can be
+                                  distributed across multiple listening processes (Linux/BSD only).
+
+            Returns:
+               Number of events discarded because the queue was full.
+        """
+        tasks = set()
+        dropped = 0
+
+        def enqueue(packet):
+            nonlocal dropped
+            try:
+                queue.put_nowait(decode.event(packet))
+            except asyncio.QueueFull:
+                dropped += 1
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                _report(on_error, exc, tasks)
+
+        await self._udp.listen(enqueue, close, reuse_port)
+
+        return dropped
+
+    async def close(self):
+        """
+        Closes any open TCP connections to the access controllers (keepalive only). Connections are
+        otherwise closed automatically after they have been idle for 15 seconds.
+
+            Returns:
+               None
+        """
+        await self._tcp.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _send(self, request, dest_addr, timeout, protocol):
         """
         Internal HAL to use either TCP or UDP to send a request to a controller and return the response.
 
+        NTS: returns the transport coroutine directly rather than awaiting it, to avoid creating an extra
+             coroutine for every request.
+
             Parameters:
                dest_addr (string)  Controller IPv4 addess:port. Defaults to broadcast address and port 60000.
                timeout   (float)   Operation timeout (in seconds). Defaults to 2.5s.
                protocol  (string)  'udp' or 'tcp'. Defaults to 'udp'.
 
             Returns:
-               Received response packet (if any) or None (for set-ip request).
+               Awaitable that returns the received response packet (if any) or None (for set-ip request).
 
             Raises:
                Exception  If request could not be sent or the access controller failed to respond.
         """
         if protocol == "tcp" and dest_addr is not None:
-            return await self._tcp.send(request, dest_addr, timeout)
+            return self._tcp.send(request, dest_addr, timeout)
 
-        return await self._udp.send(request, dest_addr=dest_addr, timeout=timeout)
+        return self._udp.send(request, dest_addr=dest_addr, timeout=timeout)
+
+
+def _report(on_error, exc, tasks):
+    """
+    Invokes the optional listener error handler, scheduling it as a task if it returns a coroutine. The
+    task is kept in 'tasks' until it completes so that it is not garbage collected.
+    """
+    if on_error is not None:
+        err = on_error(exc)
+        if asyncio.iscoroutine(err):
+            task = asyncio.create_task(err)
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
@@ -58,6 +58,23 @@ class TestEncode(unittest.TestCase):
 
         self.assertEqual(request, expected)
 
+    def test_set_time_request(self):
+        """
+        Tests message encoding for a set-time request.
+        """
+        # fmt: off
+        expected = bytearray([
+            0x17, 0x30, 0x00, 0x00, 0x78, 0x37, 0x2a, 0x18, 0x20, 0x21, 0x05, 0x28, 0x14, 0x56, 0x14, 0x00,
+            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+        ])
+        # fmt: on
+
+        request = encode.set_time_request(405419896, datetime.datetime(2021, 5, 28, 14, 56, 14))
+
+        self.assertEqual(request, expected)
+
     def test_put_card_record_request(self):
         """
         Tests message encoding for a put-card-record request.
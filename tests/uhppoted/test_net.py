@@ -4,12 +4,18 @@ UDP unit tests.
 Tests the internal conversion functions.
 """
 
+import asyncio
 import unittest
 
+from ipaddress import IPv4Address
+
+from uhppoted.net import resolve
+from uhppoted.net import resolve_addr
 from uhppoted.net import timeout_to_seconds
 from uhppoted.net import disambiguate
 from uhppoted.net import is_inaddr_any
 from uhppoted.net import Controller
+from uhppoted.net import wait_for
 
 
 class TestNet(unittest.TestCase):
@@ -17,6 +23,41 @@ class TestNet(unittest.TestCase):
     Test suite for the network utility package.
     """
 
+    def test_resolve(self):
+        """
+        Tests resolving address:port strings to (address, port) tuples.
+        """
+        tests = [
+            ("192.168.1.100", ("192.168.1.100", 60000)),
+            ("192.168.1.100:54321", ("192.168.1.100", 54321)),
+            ("255.255.255.255:60000", ("255.255.255.255", 60000)),
+        ]
+
+        resolve.cache_clear()
+
+        for test in tests:
+            self.assertEqual(resolve(test[0]), test[1])
+            self.assertEqual(resolve(test[0]), test[1])
+
+        self.assertEqual(resolve.cache_info().misses, len(tests))
+        self.assertEqual(resolve.cache_info().hits, len(tests))
+
+        with self.assertRaises(ValueError):
+            resolve("qwerty")
+
+    def test_resolve_addr(self):
+        """
+        Tests resolving string and IPv4Address controller addresses to (address, port) tuples.
+        """
+        tests = [
+            ("192.168.1.100", ("192.168.1.100", 60000)),
+            ("192.168.1.100:54321", ("192.168.1.100", 54321)),
+            (IPv4Address("192.168.1.100"), ("192.168.1.100", 60000)),
+        ]
+
+        for test in tests:
+            self.assertEqual(resolve_addr(test[0]), test[1])
+
     def test_timeout_to_seconds(self):
         """
         Tests the conversion of valid and invalid timeout values.
@@ -57,6 +98,35 @@ class TestNet(unittest.TestCase):
         for test in tests:
             self.assertEqual(disambiguate(test[0]), test[1])
 
+    def test_disambiguate_cache(self):
+        """
+        Tests that disambiguate caches hashable controller values and resolves unhashable values
+        without caching.
+        """
+        disambiguate.cache_clear()
+
+        for _ in range(3):
+            self.assertEqual(disambiguate(405419896), Controller(405419896, None, "udp"))
+            self.assertEqual(disambiguate((405419896, "192.168.1.100", "tcp")), Controller(405419896, "192.168.1.100", "tcp"))
+
+        info = disambiguate.cache_info()
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.hits, 4)
+
+        tests = [
+            ([405419896, "192.168.1.100"], Controller(None, None, "udp")),
+            ((405419896, ["192.168.1.100"]), Controller(405419896, None, "udp")),
+            ({"id": 405419896}, Controller(None, None, "udp")),
+        ]
+
+        for test in tests:
+            self.assertEqual(disambiguate(test[0]), test[1])
+
+        info = disambiguate.cache_info()
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.hits, 4)
+        self.assertEqual(info.currsize, 2)
+
     def test_is_inaddr_any(self):
         """
         Tests disambiguating a controller arg to a 'Controller' named tuple with id, address and
@@ -72,6 +142,21 @@ class TestNet(unittest.TestCase):
         for test in tests:
             self.assertEqual(is_inaddr_any(test[0]), test[1])
 
+    def test_wait_for(self):
+        """
+        Tests waiting for a future with a timeout.
+        """
+
+        async def wait(delay):
+            future = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_later(delay, future.set_result, "ok")
+            return await wait_for(future, 0.1)
+
+        self.assertEqual(asyncio.run(wait(0.01)), "ok")
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(wait(1))
+
 
 if __name__ == "__main__":
     unittest.main()